@@ -46,6 +46,31 @@ const SELECTORS = {
 // IMPORTANT: Update this selector if you find a specific error message on playwright_error.png
 const LOGIN_ERROR_SELECTOR = 'div[class*="text-red-500"], p[role="alert"], .login-error-message, .error-message';
 
+// --- Navigation retry ---
+const NAVIGATION_ATTEMPTS = 3;
+const NAVIGATION_BASE_DELAY_MS = 2000;
+
+// Retry page.goto with exponential backoff + jitter so a transient network error or 5xx doesn't fail the whole run
+async function gotoWithRetry(page, url, options) {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      const response = await page.goto(url, options);
+      // page.goto resolves normally on HTTP error statuses, so server errors have to be checked here
+      if (response && response.status() >= 500) {
+        throw new Error(`Server responded with HTTP ${response.status()} for ${url}`);
+      }
+      return response;
+    } catch (error) {
+      if (attempt >= NAVIGATION_ATTEMPTS || page.isClosed()) {
+        throw error;
+      }
+      const delay = NAVIGATION_BASE_DELAY_MS * 2 ** (attempt - 1) + Math.floor(Math.random() * 1000);
+      console.warn(`Navigation to ${url} failed (attempt ${attempt}/${NAVIGATION_ATTEMPTS}): ${error.message}. Retrying in ${delay} ms...`);
+      await new Promise((resolve) => setTimeout(resolve, delay));
+    }
+  }
+}
+
 (async () => {
   if (!MINEFORT_EMAIL || !MINEFORT_PASSWORD || !FTP_USERNAME) {
     console.error('Missing required environment variables. Make sure MINEFORT_EMAIL, MINEFORT_PASSWORD, and FTP_USERNAME secrets are set.');
@@ -65,7 +90,7 @@ const LOGIN_ERROR_SELECTOR = 'div[class*="text-red-500"], p[role="alert"], .logi
 
   try {
     console.log(`Navigating to login: ${LOGIN_URL}`);
-    await page.goto(LOGIN_URL, { waitUntil: 'domcontentloaded', timeout: 60000 });
+    await gotoWithRetry(page, LOGIN_URL, { waitUntil: 'domcontentloaded', timeout: 60000 });
 
     console.log('Attempting to handle cookie consent dialog if present...');
     const cookieDialogElement = page.locator(SELECTORS.cookieDialog);
@@ -146,7 +171,7 @@ const LOGIN_ERROR_SELECTOR = 'div[class*="text-red-500"], p[role="alert"], .logi
     console.log(`Checking current page after login attempt: ${currentUrlAfterLoginAttempt}`);
     if (!currentUrlAfterLoginAttempt.startsWith(SERVER_DASHBOARD_URL)) {
         console.log(`Current URL is not the specific server dashboard. Navigating to: ${SERVER_DASHBOARD_URL}`);
-        await page.goto(SERVER_DASHBOARD_URL, { waitUntil: 'domcontentloaded', timeout: 60000 });
+        await gotoWithRetry(page, SERVER_DASHBOARD_URL, { waitUntil: 'domcontentloaded', timeout: 60000 });
         console.log('Navigated to server dashboard.');
     } else {
         console.log('Already on the specific server dashboard or a subpage of it.');